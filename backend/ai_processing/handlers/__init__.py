@@ -1,3 +1,8 @@
+import os
+
+# Turn on parallel batch encoding in the Rust tokenizers; an explicit user setting wins.
+os.environ.setdefault("TOKENIZERS_PARALLELISM", "true")
+
 from .base_handler import ModelLoadingError
 from .summarizer_handler import EnglishSummarizer
 from .translator_handler import HebrewTranslator
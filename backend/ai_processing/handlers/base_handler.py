@@ -1,3 +1,146 @@
+import logging
+import os
+import platform
+import shutil
+from contextlib import contextmanager
+from pathlib import Path
+import torch
+from optimum.exporters.onnx import main_export
+from optimum.onnxruntime import ORTModelForSeq2SeqLM, ORTOptimizer, ORTQuantizer
+from optimum.onnxruntime.configuration import AutoQuantizationConfig, OptimizationConfig
+from transformers import AutoTokenizer
+
+logger = logging.getLogger(__name__)
+
+# Quantized ONNX exports are cached here so that only the very first startup pays
+# for the export and quantization; later startups load the artifacts from disk.
+MODEL_CACHE_DIR = Path(
+    os.environ.get("MODEL_CACHE_DIR", Path(__file__).resolve().parents[2] / "model_cache")
+)
+
+# Identifies how the cached graphs were produced. Change it whenever the export
+# steps change, so that stale cache entries are rebuilt instead of loaded.
+_CACHE_FORMAT = "optimized-int8"
+_ONNX_FILE_SUFFIX = "_optimized_quantized.onnx"
+
+
 class ModelLoadingError(Exception):
     """Custom exception for model loading failures."""
-    pass
\ No newline at end of file
+    pass
+
+
+@contextmanager
+def inference_context():
+    """
+    Disables autograd bookkeeping (version counters, view tracking) for the
+    PyTorch-side work around inference, such as tensor preparation and decoding.
+    """
+    with torch.inference_mode():
+        yield
+
+
+def _cpu_flags() -> set:
+    """Returns the instruction set flags of the host CPU (empty if they cannot be read)."""
+    try:
+        with open("/proc/cpuinfo") as f:
+            for line in f:
+                if line.startswith("flags"):
+                    return set(line.split(":", 1)[1].split())
+    except OSError:
+        pass
+    return set()
+
+
+def _select_quantization_config():
+    """
+    Picks the dynamic-quantization preset that matches the host CPU's INT8 instructions.
+
+    Returns:
+        A tuple of (preset name, AutoQuantizationConfig).
+    """
+    if platform.machine().lower() in ("arm64", "aarch64"):
+        return "arm64", AutoQuantizationConfig.arm64(is_static=False, per_channel=False)
+
+    flags = _cpu_flags()
+    if "avx512_vnni" in flags:
+        return "avx512_vnni", AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=False)
+    # Without VNNI, the u8*s8 multiply-add goes through int16 and can saturate,
+    # so the weight range is reduced to 7 bits as ONNX Runtime recommends.
+    if "avx512bw" in flags:
+        return "avx512", AutoQuantizationConfig.avx512(is_static=False, per_channel=False, reduce_range=True)
+    return "avx2", AutoQuantizationConfig.avx2(is_static=False, per_channel=False, reduce_range=True)
+
+
+def load_quantized_seq2seq(model_name: str):
+    """
+    Loads an optimized, INT8-quantized ONNX Runtime version of a seq2seq model and its tokenizer.
+
+    On a cache miss the model is exported to ONNX, graph-optimized, dynamically
+    quantized and saved to the cache directory before being loaded.
+
+    Args:
+        model_name: The HuggingFace Hub name of the model.
+
+    Returns:
+        A tuple of (ORTModelForSeq2SeqLM, tokenizer).
+    """
+    preset, quantization_config = _select_quantization_config()
+    model_dir = MODEL_CACHE_DIR / f"{_CACHE_FORMAT}-{preset}" / model_name.replace('/', '--')
+    if not model_dir.exists():
+        logger.info("No cached ONNX model found for %s. Exporting and quantizing for %s (one-time step)...",
+                    model_name, preset)
+        _export_and_quantize(model_name, model_dir, quantization_config)
+
+    model = ORTModelForSeq2SeqLM.from_pretrained(
+        model_dir,
+        encoder_file_name="encoder_model" + _ONNX_FILE_SUFFIX,
+        decoder_file_name="decoder_model" + _ONNX_FILE_SUFFIX,
+        decoder_with_past_file_name="decoder_with_past_model" + _ONNX_FILE_SUFFIX,
+    )
+    tokenizer = AutoTokenizer.from_pretrained(model_dir, use_fast=True)
+    if not tokenizer.is_fast:
+        # e.g. Marian models only ship a SentencePiece-based Python tokenizer.
+        logger.info("No fast (Rust) tokenizer is available for %s; using the slow tokenizer.", model_name)
+
+    # Pipelines truncate inputs to `model_max_length`, so make sure it never
+    # exceeds what the model's position embeddings can actually handle.
+    if tokenizer.model_max_length > model.config.max_position_embeddings:
+        tokenizer.model_max_length = model.config.max_position_embeddings
+    return model, tokenizer
+
+
+def _export_and_quantize(model_name: str, model_dir: Path, quantization_config) -> None:
+    """Exports a model to ONNX, optimizes and quantizes every graph to INT8 and saves it to `model_dir`."""
+    # Build into a temporary directory first, so an interrupted export never
+    # leaves behind a half-written cache entry.
+    build_dir = model_dir.with_name(model_dir.name + ".tmp")
+    export_dir = build_dir / "export"
+    optimized_dir = build_dir / "optimized"
+    shutil.rmtree(build_dir, ignore_errors=True)
+
+    # Export straight to disk; the FP32 PyTorch model is released as soon as the
+    # export returns, and the later steps work on the saved graphs instead of
+    # keeping an FP32 ONNX Runtime model loaded alongside them.
+    main_export(model_name, output=export_dir, task="text2text-generation-with-past",
+                do_validation=False, no_post_process=True)
+
+    # Fuse attention, LayerNorm and GELU subgraphs into ONNX Runtime's dedicated
+    # transformer kernels, so attention no longer runs as separate matmul/softmax ops.
+    optimization_config = OptimizationConfig(optimization_level=2, enable_transformers_specific_optimizations=True)
+    optimizer = ORTOptimizer.from_pretrained(export_dir, file_names=[p.name for p in sorted(export_dir.glob("*.onnx"))])
+    optimizer.optimize(save_dir=optimized_dir, optimization_config=optimization_config)
+
+    # Dynamic quantization: weights are stored as INT8, activations are quantized on the fly.
+    for onnx_path in sorted(optimized_dir.glob("*.onnx")):
+        quantizer = ORTQuantizer.from_pretrained(optimized_dir, file_name=onnx_path.name)
+        quantizer.quantize(save_dir=build_dir, quantization_config=quantization_config)
+
+    # Keep the model/generation configs next to the quantized graphs; drop the FP32 graphs.
+    for path in export_dir.iterdir():
+        if path.suffix == ".json":
+            shutil.copy2(path, build_dir / path.name)
+    shutil.rmtree(export_dir)
+    shutil.rmtree(optimized_dir)
+    AutoTokenizer.from_pretrained(model_name, use_fast=True).save_pretrained(build_dir)
+
+    os.replace(build_dir, model_dir)
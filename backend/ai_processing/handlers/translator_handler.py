@@ -1,6 +1,6 @@
 import logging
 from transformers import pipeline
-from .base_handler import ModelLoadingError
+from .base_handler import ModelLoadingError, inference_context, load_quantized_seq2seq
 
 logger = logging.getLogger(__name__)
 
@@ -8,15 +8,18 @@ class HebrewTranslator:
     """
     Handles the English-to-Hebrew translation model.
     """
+    # Two beams are kept as a quality compromise for translation, at a fraction
+    # of the cost of a wider beam search.
+    GENERATION_KWARGS = {'num_beams': 2, 'early_stopping': True}
+
     def __init__(self):
         """
-        Initializes the English-to-Hebrew translation pipeline.
+        Initializes the English-to-Hebrew translation pipeline on a quantized ONNX Runtime model.
         """
         try:
             logger.info("Loading English-to-Hebrew translation model (Helsinki-NLP/opus-mt-en-he)...")
-            self.pipeline = pipeline(
-                "translation_en_to_he", model="Helsinki-NLP/opus-mt-en-he"
-            )
+            model, tokenizer = load_quantized_seq2seq("Helsinki-NLP/opus-mt-en-he")
+            self.pipeline = pipeline("translation_en_to_he", model=model, tokenizer=tokenizer)
             logger.info("English-to-Hebrew translation model loaded successfully.")
         except Exception:
             logger.exception("Failed to load the English-to-Hebrew translation model.")
@@ -26,11 +29,14 @@ class HebrewTranslator:
         """
         Translates English text to Hebrew, handling truncation internally.
         """
-        # Truncate text to fit the model's context window (512 tokens)
-        truncated_text = self.pipeline.tokenizer.decode(
-            self.pipeline.tokenizer.encode(text, max_length=510, truncation=True),
-            skip_special_tokens=True
-        )
+        return self.translate_batch_to_hebrew([text], max_length=max_length)[0]
 
-        result = self.pipeline(truncated_text, max_length=max_length)
-        return result[0]['translation_text']
\ No newline at end of file
+    def translate_batch_to_hebrew(self, texts: list[str], max_length: int) -> list[str]:
+        """
+        Translates several English texts to Hebrew with a single batched pipeline call.
+        """
+        # The tokenizer truncates each text to the model's context window (512 tokens)
+        with inference_context():
+            results = self.pipeline(texts, max_length=max_length, truncation=True, batch_size=len(texts),
+                                    **self.GENERATION_KWARGS)
+        return [result['translation_text'] for result in results]
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import langdetect
 from .article_fetcher import fetch_article_text, ArticleFetchingError
@@ -11,6 +12,99 @@ logger = logging.getLogger(__name__)
 langdetect.DetectorFactory.seed = 0
 
 
+class MicroBatcher:
+    """
+    Coalesces concurrent calls to a batch function into a single batched call.
+
+    Requests arriving within `max_delay` seconds of each other (up to
+    `max_batch_size` of them) are grouped by their keyword arguments and sent to
+    the model together, so the pipeline sees a real batch instead of batch size 1.
+    """
+
+    def __init__(self, batch_fn, max_batch_size: int = 8, max_delay: float = 0.02):
+        """
+        Args:
+            batch_fn: A blocking callable taking a list of texts plus keyword
+                arguments and returning one result per text.
+            max_batch_size: The maximum number of texts sent in one call.
+            max_delay: How long (in seconds) to wait for more requests to arrive.
+        """
+        self._batch_fn = batch_fn
+        self._max_batch_size = max_batch_size
+        self._max_delay = max_delay
+        self._queue = None
+        self._worker = None
+
+    async def submit(self, text: str, **kwargs):
+        """Queues a single text and waits for its result from the next batch."""
+        if self._worker is None or self._worker.done():
+            # Created lazily so they are bound to the running event loop.
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._run())
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((text, kwargs, future))
+        return await future
+
+    async def _collect_batch(self) -> list:
+        """Waits for the first request, then gathers more until the batch is full or the window closes."""
+        batch = [await self._queue.get()]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._max_delay
+        while len(batch) < self._max_batch_size:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run(self) -> None:
+        """Background task that drains the queue and runs the batched calls."""
+        while True:
+            batch = await self._collect_batch()
+
+            # Only requests with identical generation parameters can share a call.
+            groups = {}
+            for text, kwargs, future in batch:
+                groups.setdefault(tuple(sorted(kwargs.items())), []).append((text, future))
+
+            for key, items in groups.items():
+                kwargs = dict(key)
+                texts = [text for text, _ in items]
+                try:
+                    # Inference is blocking, so run it in a worker thread to keep the loop free.
+                    results = await asyncio.to_thread(self._batch_fn, texts, **kwargs)
+                except Exception as e:
+                    if len(items) == 1:
+                        self._resolve(items[0][1], exception=e)
+                        continue
+                    # Don't let one bad input fail every request that shared its batch:
+                    # retry each text on its own so only the failing ones get the error.
+                    for text, future in items:
+                        try:
+                            result = (await asyncio.to_thread(self._batch_fn, [text], **kwargs))[0]
+                        except Exception as single_error:
+                            self._resolve(future, exception=single_error)
+                        else:
+                            self._resolve(future, result=result)
+                    continue
+                for (_, future), result in zip(items, results):
+                    self._resolve(future, result=result)
+
+    @staticmethod
+    def _resolve(future, result=None, exception=None) -> None:
+        """Sets a request's result or exception, unless its caller already gave up on it."""
+        if future.done():
+            return
+        if exception is not None:
+            future.set_exception(exception)
+        else:
+            future.set_result(result)
+
+
 class AiProcessor:
     """
     Orchestrates the process of fetching, summarizing, and translating web articles.
@@ -21,7 +115,10 @@ class AiProcessor:
         try:
             self.english_summarizer = EnglishSummarizer()
             self.hebrew_translator = HebrewTranslator()
+            self.summarizer_batcher = MicroBatcher(self.english_summarizer.summarize_batch)
+            self.translator_batcher = MicroBatcher(self.hebrew_translator.translate_batch_to_hebrew)
             self.initialization_error = None
+            self._warm_up_models()
             logger.info("AI Processor initialized successfully.")
         except ModelLoadingError:
             logger.exception("Failed to initialize one or more AI models. The processor will be unavailable.")
@@ -46,10 +143,31 @@ class AiProcessor:
             'long': {'min_length': 250, 'max_length': 450}
         }
 
-    def _get_source_language_info(self, text: str) -> dict:
+    def _warm_up_models(self) -> None:
+        """
+        Runs one inference through each model at its full input shape, so that the
+        first real request does not pay for growing the memory pools and the first
+        run at the ~1024/512-token encoder shapes.
+        """
+        try:
+            logger.info("Warming up AI models...")
+            # Long enough to be truncated to each model's context window.
+            warm_up_text = "Warm up. " * 600
+            self.english_summarizer.summarize(warm_up_text, min_length=5, max_length=10)
+            self.hebrew_translator.translate_to_hebrew(warm_up_text, max_length=10)
+        except Exception:
+            # A failed warm-up is not fatal; the first request will just be slower.
+            logger.exception("Model warm-up failed.")
+
+    def _get_source_language_info(self, text: str, lang_hint: str = None) -> dict:
         """
         Detects the source language of the text and returns its properties.
+        A page that declares itself English via `lang_hint` skips detection entirely.
         """
+        if lang_hint and lang_hint.strip().lower().startswith('en'):
+            logger.info("Source language 'en' (English) taken from the page's lang attribute.")
+            return {"is_english": True, "mbart_code": MBART_LANG_MAP['en'], "name": "English"}
+
         try:
             detected_lang = langdetect.detect(text[:1000])
             lang_map = {'en': 'English', 'he': 'Hebrew'}
@@ -64,7 +182,7 @@ class AiProcessor:
             logger.warning("Language detection failed for the provided text snippet. Assuming not English.")
             return {"is_english": False, "mbart_code": None, "name": "Unknown"}
 
-    def process_url(self, url: str, target_lang: str, summary_level: str = 'medium') -> dict:
+    async def process_url(self, url: str, target_lang: str, summary_level: str = 'medium') -> dict:
         """Fetches, summarizes, and translates content from a URL."""
         if self.initialization_error:
             raise RuntimeError(
@@ -82,7 +200,7 @@ class AiProcessor:
             raise ValueError(f"Summary level '{summary_level}' is not supported.")
 
         try:
-            article_text = fetch_article_text(url)
+            article_text, lang_hint = await fetch_article_text(url)
         except ArticleFetchingError as e:
             logger.exception("Failed to fetch or parse article from URL: %s", url)
             raise RuntimeError(f"Failed to fetch content from the provided URL: {url}") from e
@@ -92,14 +210,14 @@ class AiProcessor:
 
         # --- Simplified Core Logic ---
 
-        source_info = self._get_source_language_info(article_text)
+        source_info = self._get_source_language_info(article_text, lang_hint)
         lengths = summary_levels[summary_level]
 
         if source_info["is_english"]:
             # --- High-Quality English Source Path ---
             logger.info("Step 1/2: Summarizing English text...")
-            english_summary = self.english_summarizer.summarize(
-                text=article_text,
+            english_summary = await self.summarizer_batcher.submit(
+                article_text,
                 min_length=lengths['min_length'],
                 max_length=lengths['max_length']
             )
@@ -110,8 +228,8 @@ class AiProcessor:
                 result_text = english_summary
             elif target_lang == 'he':
                 logger.info("Step 2/2: Translating summary to Hebrew...")
-                result_text = self.hebrew_translator.translate_to_hebrew(english_summary,
-                                                                         max_length=lengths['max_length'])
+                result_text = await self.translator_batcher.submit(english_summary,
+                                                                   max_length=lengths['max_length'])
 
             return {
                 "processed_text": result_text,
@@ -1,15 +1,15 @@
-import os
+import re
 import logging
 from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import StreamingResponse
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
 from typing import Literal
-import tempfile
 
 from model import EdgeTtsModel
 from ai_processing.orchestrator import AiProcessor
+from ai_processing.article_fetcher import close_client
 
 # --- Logging Configuration ---
 # This sets up a basic configuration for logging throughout the application.
@@ -21,7 +21,8 @@ logging.basicConfig(
 
 # --- FastAPI App Initialization ---
 
-app = FastAPI()
+# orjson serializes responses (notably long non-ASCII summaries) much faster than the stdlib json.
+app = FastAPI(default_response_class=ORJSONResponse)
 
 # --- CORS (Cross-Origin Resource Sharing) ---
 # This is necessary to allow the React development server (on a different port)
@@ -44,6 +45,11 @@ logging.info("Initializing AI Processor... (This may take a moment)")
 ai_processor = AiProcessor()
 logging.info("Initialization complete.")
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Releases the pooled HTTP connections used for fetching articles."""
+    await close_client()
+
 # --- Pydantic Models for API ---
 
 class SynthesizeRequest(BaseModel):
@@ -58,50 +64,57 @@ class ProcessUrlRequest(BaseModel):
 
 # --- API Endpoints ---
 
-@app.get("/api/voices")
-async def get_voices():
-    """
-    Dynamically fetches and formats the available voices from the TTS service,
-    grouping them by language for the frontend.
-    """
-    try:
-        all_voices = await tts_model.list_voices()
-    except Exception as e:
-        # If the voice service is down or there's an issue, return an error
-        raise HTTPException(status_code=503, detail=f"Could not fetch voices from service: {e}")
+# Extracts a clean name like "Hila" from "he-IL-HilaNeural"
+_VOICE_NAME_RE = re.compile(r'^[a-z]{2}-[A-Z]{2}-(.+?)(?:Neural)?$')
 
-    # Helper to extract a clean name like "Hila" from "he-IL-HilaNeural"
-    def get_name_from_shortname(short_name):
-        parts = short_name.split('-')
-        if len(parts) > 2:
-            return parts[2].replace('Neural', '')
-        return short_name  # Fallback
+# Maps each locale to include to its group name in the UI and a formatter for the
+# gender label shown next to the voice name.
+_LOCALE_GROUPS = {
+    "he-IL": ("Hebrew", lambda gender: 'נקבה' if gender == 'Female' else 'זכר'),
+    "en-US": ("English", lambda gender: gender),
+}
 
-    # Helper for Hebrew gender translation
-    def get_hebrew_gender(gender):
-        return 'נקבה' if gender == 'Female' else 'זכר'
+# The voice list does not change while the server runs, so it is built only once.
+_voice_cache = None
 
-    # Define which languages to include and their group names in the UI
-    language_groups = {
-        "Hebrew": "he-IL",
-        "English": "en-US",
-    }
+async def _build_voice_map() -> dict:
+    """
+    Fetches the available voices from the TTS service and formats them,
+    grouping them by language for the frontend.
+    """
+    all_voices = await tts_model.list_voices()
 
-    formatted_voices = {name: {} for name in language_groups.keys()}
+    formatted_voices = {group: {} for group, _ in _LOCALE_GROUPS.values()}
 
     for voice in all_voices:
-        locale = voice.get('Locale', '')
-        short_name = voice.get('ShortName', '')
-        gender = voice.get('Gender', '')
-        name = get_name_from_shortname(short_name)
+        locale_group = _LOCALE_GROUPS.get(voice.get('Locale', ''))
+        if locale_group is None:
+            continue
 
-        if locale == language_groups["Hebrew"]:
-            formatted_voices["Hebrew"][short_name] = f"{get_hebrew_gender(gender)} ({name})"
-        elif locale == language_groups["English"]:
-            formatted_voices["English"][short_name] = f"{gender} ({name})"
+        group, format_gender = locale_group
+        short_name = voice.get('ShortName', '')
+        match = _VOICE_NAME_RE.match(short_name)
+        name = match.group(1) if match else short_name  # Fallback
+        formatted_voices[group][short_name] = f"{format_gender(voice.get('Gender', ''))} ({name})"
 
     return formatted_voices
 
+@app.get("/api/voices")
+async def get_voices():
+    """
+    Returns the available voices from the TTS service, grouped by language for the
+    frontend. The list is fetched on the first request and cached afterwards.
+    """
+    global _voice_cache
+    if _voice_cache is None:
+        try:
+            _voice_cache = await _build_voice_map()
+        except Exception as e:
+            # If the voice service is down or there's an issue, return an error
+            raise HTTPException(status_code=503, detail=f"Could not fetch voices from service: {e}")
+
+    return _voice_cache
+
 @app.post("/api/process-url")
 async def process_url_endpoint(request: ProcessUrlRequest):
     """
@@ -109,7 +122,7 @@ async def process_url_endpoint(request: ProcessUrlRequest):
     to the target language, and returns the resulting text.
     """
     try:
-        processed_data = ai_processor.process_url(
+        processed_data = await ai_processor.process_url(
             url=request.url,
             target_lang=request.target_lang,
             summary_level=request.summary_level
@@ -131,30 +144,24 @@ async def synthesize_speech(request: SynthesizeRequest):
     if not request.text or not request.voice:
         raise HTTPException(status_code=400, detail="Text and voice must be provided.")
 
+    audio_stream = tts_model.stream(request.text, request.voice)
     try:
-        # Create a temporary file to store the audio
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".mp3") as tmp_file:
-            output_path = tmp_file.name
-
-        # Synthesize the audio using the model
-        await tts_model.synthesize_to_file(request.text, request.voice, output_path)
-
-        # Stream the file back to the client
-        def file_iterator(path):
-            try:
-                with open(path, "rb") as f:
-                    yield from f
-            finally:
-                os.remove(path) # Clean up the file after streaming is complete
-
-        return StreamingResponse(file_iterator(output_path), media_type="audio/mpeg")
-
+        # Wait for the first chunk before responding, so that synthesis errors
+        # (e.g. an unknown voice) are still reported as a proper HTTP error.
+        first_chunk = await audio_stream.__anext__()
+    except StopAsyncIteration:
+        first_chunk = b""
     except Exception as e:
-        # Clean up the temp file in case of an error
-        if 'output_path' in locals() and os.path.exists(output_path):
-            os.remove(output_path)
         raise HTTPException(status_code=500, detail=str(e))
 
+    # Stream the audio back to the client as it is synthesized
+    async def audio_iterator():
+        yield first_chunk
+        async for chunk in audio_stream:
+            yield chunk
+
+    return StreamingResponse(audio_iterator(), media_type="audio/mpeg")
+
 # --- Static Files Mount ---
 # This must be after all API routes
 app.mount("/", StaticFiles(directory="../frontend/build", html=True), name="static")
\ No newline at end of file
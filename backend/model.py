@@ -16,8 +16,19 @@ class EdgeTtsModel:
         '[^\x09\x0A\x0D\x20-\uD7FF\uE000-\uFFFD\U00010000-\U0010FFFF]'
     )
 
+    # For pure-ASCII text the only invalid characters are the C0 controls other
+    # than tab/LF/CR, and str.translate() deletes those faster than the regex.
+    _INVALID_ASCII_CHARS_TABLE = dict.fromkeys(c for c in range(0x20) if c not in (0x09, 0x0A, 0x0D))
+
+    # Matches any run of whitespace, including line breaks.
+    _WHITESPACE_RE = re.compile(r'\s+')
+
     def _strip_invalid_xml_chars(self, text: str) -> str:
-        """Removes characters that are invalid in XML using a pre-compiled regex."""
+        """Removes characters that are invalid in XML, with a fast path for pure-ASCII text."""
+        # str.translate() is only fast on ASCII input; for anything else (e.g. Hebrew,
+        # typographic punctuation) it does a dict lookup per character, so use the regex.
+        if text.isascii():
+            return text.translate(self._INVALID_ASCII_CHARS_TABLE)
         return self._INVALID_XML_CHARS_RE.sub('', text)
 
     def _preprocess_text(self, text: str) -> str:
@@ -25,17 +36,10 @@ class EdgeTtsModel:
         Cleans and prepares plain text for synthesis by removing invalid characters
         and normalizing whitespace. This provides robustness without using SSML.
         """
-        clean_lines = []
-        lines = text.splitlines()
-        for line in lines:
-            # Sanitize the line by stripping whitespace and invalid XML characters.
-            clean_line = self._strip_invalid_xml_chars(line.strip())
-            if clean_line:
-                clean_lines.append(clean_line)
-        
-        # Join the cleaned lines with a space. The TTS engine is smart enough
-        # to handle pauses based on punctuation like periods and commas.
-        return " ".join(clean_lines)
+        # Line breaks collapse into single spaces along with all other whitespace.
+        # The TTS engine is smart enough to handle pauses based on punctuation
+        # like periods and commas.
+        return self._WHITESPACE_RE.sub(' ', self._strip_invalid_xml_chars(text)).strip()
 
     async def synthesize_to_file(self, text: str, voice: str, output_path: str) -> None:
         """
@@ -47,6 +51,18 @@ class EdgeTtsModel:
         communicate = edge_tts.Communicate(processed_text, voice)
         await communicate.save(output_path)
 
+    async def stream(self, text: str, voice: str):
+        """
+        Synthesizes the given text using the specified voice, yielding the MP3
+        audio in chunks as they arrive from the service.
+        """
+        # Preprocess the raw text to clean it up before sending to the engine.
+        processed_text = self._preprocess_text(text)
+        communicate = edge_tts.Communicate(processed_text, voice)
+        async for chunk in communicate.stream():
+            if chunk["type"] == "audio":
+                yield chunk["data"]
+
     async def list_voices(self):
         """Returns a sorted list of available voices from edge-tts."""
         voices = await edge_tts.list_voices()